@@ -0,0 +1,27 @@
+"""
+XIV Auto Crafter package.
+Exposes the main MVC components, imported lazily on first access.
+"""
+
+_LAZY_ATTRIBUTES = {
+    "XIVAutoCrafterView": "src.view",
+    "XIVAutoCrafterController": "src.controller",
+    "XIVAutoCrafterModel": "src.model",
+}
+
+def __getattr__(name: str):
+    """
+    Resolve the main components on first access instead of at package import.
+    
+    Args:
+        name: Name of the requested attribute
+        
+    Returns:
+        The requested component class
+    """
+    if name in _LAZY_ATTRIBUTES:
+        import importlib
+        value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
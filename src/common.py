@@ -3,11 +3,16 @@ Common module for the XIV Auto Crafter application.
 Contains shared interfaces, enums, and abstract base classes used throughout the application.
 """
 
-from abc import ABC, abstractmethod
+from __future__ import annotations
+
+from abc import abstractmethod
 import customtkinter as ctk
-from enum import StrEnum, Enum
+from enum import StrEnum, Enum, IntFlag
+from typing import TYPE_CHECKING
 
-from src.model import Action, Recipe
+if TYPE_CHECKING:
+    # Only needed for annotations, avoids importing the model and its automation dependencies
+    from src.model import Action, Recipe
 
 class LogSeverity(StrEnum):
     """Enumeration for log message severity levels."""
@@ -15,11 +20,11 @@ class LogSeverity(StrEnum):
     ERROR = "ERROR"
     WARNING = "WARNING"
 
-class ControllerState(Enum):
-    """Enumeration for controller state values."""
-    STOPPED = "stopped"
-    RUNNING = "running"
-    PAUSED = "paused"
+class ControllerState(IntFlag):
+    """Enumeration for controller state values, as flags so that states can be tested with a bitmask."""
+    STOPPED = 1
+    RUNNING = 2
+    PAUSED = 4
 
 class Notification(Enum):
     """Enumeration for notification types sent between components."""
@@ -28,11 +33,21 @@ class Notification(Enum):
     ACTION_LIST = "action_list"
     FIXED_ACTIONS = "fixed_actions"
 
-class AutoCrafterControllerInterface(ABC):
+class AutoCrafterControllerInterface:
     """
     Abstract base class defining the interface for controller implementations.
     Provides contract for recipe management, action management, and crafting operations.
     """
+
+    def __init_subclass__(cls, **kwargs):
+        """
+        Register the methods left abstract by a subclass.
+        Instantiating a subclass with remaining abstract methods raises TypeError, without the cost of ABCMeta.
+        """
+        super().__init_subclass__(**kwargs)
+        cls.__abstractmethods__ = frozenset(
+            name for name in dir(cls) if getattr(getattr(cls, name, None), "__isabstractmethod__", False)
+        )
     
     def __init__(self, *args, **kwargs):
         """
@@ -158,7 +173,7 @@ class AutoCrafterControllerInterface(ABC):
         """Set the right movement action shortcut."""
         pass
 
-class AutoCrafterViewInterface(ctk.CTk, ABC):
+class AutoCrafterViewInterface(ctk.CTk):
     """
     Abstract base class defining the interface for view implementations.
     Extends customtkinter's CTk class and provides contract for UI operations.
@@ -176,19 +191,19 @@ class AutoCrafterViewInterface(ctk.CTk, ABC):
     @abstractmethod
     def log(self, message: str, severity: LogSeverity = LogSeverity.INFO) -> None:
         """Display a log message with specified severity."""
-        pass
+        raise NotImplementedError
 
     @abstractmethod
     def set_progress(self, value: float) -> None:
         """Update the progress display."""
-        pass
+        raise NotImplementedError
 
     @abstractmethod
     def notify(self, notification_type: Notification, content: ControllerState | list[str] | dict[str, str]) -> None:
         """Handle notifications from the controller."""
-        pass
+        raise NotImplementedError
 
     @abstractmethod
     def set_controller(self, controller: AutoCrafterControllerInterface) -> None:
         """Set the controller reference for the view."""
-        pass
+        raise NotImplementedError
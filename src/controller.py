@@ -4,16 +4,29 @@ Controller module for the XIV Auto Crafter application.
 Implements the business logic and coordinates between the model and view components.
 """
 
+import atexit
+import queue
+import sys
 import threading
 import time
 
-from src.common import *
-from src.model import XIVAutoCrafterModel, Recipe, Action
+from src.common import AutoCrafterControllerInterface, AutoCrafterViewInterface, ControllerState, LogSeverity, Notification
+from src.model import FIXED_ACTION_NAMES, XIVAutoCrafterModel, Recipe, Action
 
 # Buff durations (in seconds)
 FOOD_DURATION = 30 * 60  # 30 minutes
 POTION_DURATION = 15 * 60  # 15 minutes
 
+# Delay (in seconds) used to coalesce bursts of changes into a single save
+SAVE_DEBOUNCE = 0.25
+# Maximum time (in seconds) to wait for pending saves on exit
+SAVE_FLUSH_TIMEOUT = 5
+
+# Backoff between craft window checks (in seconds): first delay, growth factor and cap
+CRAFT_WINDOW_POLL_MIN = 0.25
+CRAFT_WINDOW_POLL_FACTOR = 1.5
+CRAFT_WINDOW_POLL_MAX = 3.0
+
 class XIVAutoCrafterController(AutoCrafterControllerInterface):
     """
     Main controller class that manages crafting operations, recipes, and actions.
@@ -34,22 +47,36 @@ class XIVAutoCrafterController(AutoCrafterControllerInterface):
         """
         self._model = model
         self._view = view
+        # Bound view methods are resolved once instead of on every call
+        self._log = view.log
+        self._set_progress = view.set_progress
+        self._view_notify = view.notify
+        self._after_idle = view.after_idle
         self._quantity = None
         self._view.set_controller(self)
-        self._pause_event = threading.Event()
-        self._pause_event.set()
         self._thread = None
         self._state = ControllerState.STOPPED
-        self._food_time = None
-        self._potion_time = None
+        self._state_changed = threading.Condition()
+        self._food_deadline = None
+        self._potion_deadline = None
+        
+        self._recipe_names = None
+        self._action_names = None
         
         self._model.load_data()
-        self._view.notify(Notification.RECIPE_LIST, self._model.recipes.keys())
-        self._view.notify(Notification.ACTION_LIST, self._model.actions.keys())
+
+        # Changes are persisted by a background writer, flushed on exit
+        self._save_queue = queue.Queue(maxsize=1)
+        self._saver = threading.Thread(target=self._save_loop, daemon=True)
+        self._saver.start()
+        atexit.register(self._flush)
+
+        self._notify_recipe_list()
+        self._notify_action_list()
         
         # Notify view about all fixed action shortcuts as a dictionary
-        fixed_actions = {name: self._model.__getattribute__(name).shortcut for name in vars(self._model).keys() if "f_action" in name}
-        self._view.notify(Notification.FIXED_ACTIONS, fixed_actions)
+        fixed_actions = {name: getattr(self._model, name).shortcut for name in FIXED_ACTION_NAMES}
+        self._notify(Notification.FIXED_ACTIONS, fixed_actions)
 
     def add_recipe(self, name: str, action_names: list[str], use_food: bool = False, use_potion: bool = False, use_hq_ingredients: bool = False) -> bool:
         """
@@ -65,11 +92,12 @@ class XIVAutoCrafterController(AutoCrafterControllerInterface):
         Returns:
             True if recipe was added successfully, False if name already exists
         """
-        if name in self._model.recipes:
+        recipe = Recipe(action_names, use_food, use_potion, use_hq_ingredients)
+        if self._model.recipes.setdefault(name, recipe) is not recipe:
             return False
-        self._model.recipes[name] = Recipe(action_names, use_food, use_potion, use_hq_ingredients)
-        self._model.save_data()
-        self._view.notify(Notification.RECIPE_LIST, self._model.recipes.keys())
+        self._model.index_recipe(name, recipe)
+        self._request_save()
+        self._notify_recipe_list()
         return True
     
     def modify_recipe(self, current_name: str, new_name: str, action_names: list[str], use_food: bool = False, use_potion: bool = False, use_hq_ingredients: bool = False) -> bool:
@@ -87,15 +115,19 @@ class XIVAutoCrafterController(AutoCrafterControllerInterface):
         Returns:
             True if recipe was modified successfully, False if operation failed
         """
-        if current_name not in self._model.recipes:
-            return False
+        recipes = self._model.recipes
         if new_name != current_name:
-            if new_name in self._model.recipes:
+            if new_name in recipes or (recipe := recipes.pop(current_name, None)) is None:
                 return False
-            del self._model.recipes[current_name]
-        self._model.recipes[new_name] = Recipe(action_names, use_food, use_potion, use_hq_ingredients)
-        self._model.save_data()
-        self._view.notify(Notification.RECIPE_LIST, self._model.recipes.keys())
+            recipes[new_name] = recipe
+        elif (recipe := recipes.get(current_name)) is None:
+            return False
+        # The existing recipe object is updated in place rather than replaced
+        self._model.unindex_recipe(current_name, recipe)
+        recipe.update(action_names, use_food, use_potion, use_hq_ingredients)
+        self._model.index_recipe(new_name, recipe)
+        self._request_save()
+        self._notify_recipe_list()
         return True
 
     def remove_recipe(self, name: str) -> bool:
@@ -108,13 +140,75 @@ class XIVAutoCrafterController(AutoCrafterControllerInterface):
         Returns:
             True if recipe was removed successfully, False if recipe not found
         """
-        if name not in self._model.recipes:
+        if (recipe := self._model.recipes.pop(name, None)) is None:
             return False
-        del self._model.recipes[name]
-        self._model.save_data()
-        self._view.notify(Notification.RECIPE_LIST, self._model.recipes.keys())
+        self._model.unindex_recipe(name, recipe)
+        self._request_save()
+        self._notify_recipe_list()
         return True
 
+    def _request_save(self) -> None:
+        """
+        Ask the background writer to persist the model.
+        A request made while another one is pending is merged into it.
+        """
+        try:
+            self._save_queue.put_nowait(True)
+        except queue.Full:
+            pass
+
+    def _save_loop(self) -> None:
+        """
+        Internal method that runs in a separate thread and persists the model.
+        Waits for save requests and coalesces bursts of mutations into a single save.
+        Stops when it receives a False request.
+        """
+        while self._save_queue.get():
+            time.sleep(SAVE_DEBOUNCE)
+            self._model.save_data()
+
+    def _flush(self) -> None:
+        """
+        Stop the background writer once pending saves are written.
+        Registered at exit so that debounced changes are not lost on shutdown.
+        """
+        if self._saver.is_alive():
+            self._save_queue.put(False)
+            self._saver.join(timeout=SAVE_FLUSH_TIMEOUT)
+
+    def _notify(self, notification_type: Notification, content: ControllerState | tuple[str, ...] | dict[str, str]) -> None:
+        """
+        Schedule a notification on the view's event loop once it is idle.
+        Keeps controller mutations and the crafting thread from waiting on widget redraws.
+        
+        Args:
+            notification_type: The type of notification to send
+            content: The content or data associated with the notification
+        """
+        self._after_idle(self._view_notify, notification_type, content)
+
+    def _notify_recipe_list(self) -> None:
+        """
+        Refresh the cached tuple of recipe names and send it to the view.
+        The view is only notified when the names actually changed.
+        """
+        recipe_names = tuple(self._model.recipes)
+        if recipe_names == self._recipe_names:
+            return
+        self._recipe_names = recipe_names
+        self._notify(Notification.RECIPE_LIST, recipe_names)
+
+    def _notify_action_list(self) -> None:
+        """
+        Refresh the cached tuple of action names and send it to the view.
+        The view is only notified when the names actually changed.
+        """
+        action_names = tuple(self._model.actions)
+        if action_names == self._action_names:
+            return
+        self._action_names = action_names
+        self._notify(Notification.ACTION_LIST, action_names)
+
     def get_recipes(self) -> dict[str, Recipe]:
         """
         Get all recipes from the model.
@@ -147,11 +241,11 @@ class XIVAutoCrafterController(AutoCrafterControllerInterface):
         Returns:
             True if action was added successfully, False if name already exists
         """
-        if name in self._model.actions:
+        if self._model.actions.setdefault(name, action) is not action:
             return False
-        self._model.actions[name] = action
-        self._model.save_data()
-        self._view.notify(Notification.ACTION_LIST, self._model.actions.keys())
+        self._model.reset_resolved_actions(name)
+        self._request_save()
+        self._notify_action_list()
         return True
     
     def modify_action(self, current_name: str, new_name: str, action: Action) -> bool:
@@ -166,18 +260,17 @@ class XIVAutoCrafterController(AutoCrafterControllerInterface):
         Returns:
             True if action was modified successfully, False if operation failed
         """
-        if current_name not in self._model.actions:
-            return False
+        actions = self._model.actions
         if new_name != current_name:
-            if new_name in self._model.actions:
+            if new_name in actions or actions.pop(current_name, None) is None:
                 return False
-            else:
-                self._model.actions[new_name] = action
-                del self._model.actions[current_name]            
-        else:
-            self._model.actions[current_name] = action
-        self._model.save_data()
-        self._view.notify(Notification.ACTION_LIST, self._model.actions.keys())
+        elif current_name not in actions:
+            return False
+        actions[new_name] = action
+        self._model.reset_resolved_actions(current_name)
+        self._model.reset_resolved_actions(new_name)
+        self._request_save()
+        self._notify_action_list()
         return True
 
     def remove_action(self, name: str) -> bool:
@@ -190,16 +283,21 @@ class XIVAutoCrafterController(AutoCrafterControllerInterface):
         Returns:
             True if action was removed successfully, False if action not found
         """
-        if name not in self._model.actions:
+        if self._model.actions.pop(name, None) is None:
             return False
-        action_to_delete = self._model.actions.pop(name, None)
-        for recipe in self._model.recipes.values():
-            recipe.action_names = [
-                f"Deleted: {name}" if action_name == name else action_name 
-                for action_name in recipe.action_names
-            ]
-        self._model.save_data()
-        self._view.notify(Notification.ACTION_LIST, self._model.actions.keys())
+        # Only visit the recipes that reference the action, using the model's reverse index
+        affected = self._model.action_recipes.pop(name, None)
+        if affected:
+            deleted_name = sys.intern(f"Deleted: {name}")
+            for recipe_name in affected:
+                recipe = self._model.recipes[recipe_name]
+                recipe.action_names = [
+                    deleted_name if action_name == name else action_name 
+                    for action_name in recipe.action_names
+                ]
+            self._model.action_recipes.setdefault(deleted_name, set()).update(affected)
+        self._request_save()
+        self._notify_action_list()
         return True
     
     def get_actions(self) -> dict[str, Action]:
@@ -239,60 +337,60 @@ class XIVAutoCrafterController(AutoCrafterControllerInterface):
                 
                 self._quantity = int(quantity)
                 self._selected_recipe = recipe_name  # Store for the crafting loop
-                self._state = ControllerState.RUNNING
-                self._pause_event.set()
-                self._view.notify(Notification.CONTROLLER_STATE, self._state)
+                self._set_state(ControllerState.RUNNING)
 
                 if not self._thread or not self._thread.is_alive():
                     self._thread = threading.Thread(target=self._crafting_loop, daemon=True)
                     self._thread.start()
-                    self._view.log("Crafting started.")
+                    self._log("Crafting started.")
 
             except ValueError:
-                self._view.log("Invalid quantity.", severity=LogSeverity.ERROR)
+                self._log("Invalid quantity.", severity=LogSeverity.ERROR)
             except self.CraftingError as e:
-                self._view.log(f"{e}", severity=LogSeverity.ERROR)
+                self._log(f"{e}", severity=LogSeverity.ERROR)
                 self.stop_crafting()
 
     def stop_crafting(self) -> None:
         """
         Stop the current crafting process and reset the controller state.
         """
-        if self._state in (ControllerState.RUNNING, ControllerState.PAUSED):
-            self._state = ControllerState.STOPPED
-            self._pause_event.set()
-            self._view.notify(Notification.CONTROLLER_STATE, self._state)
+        if self._state & (ControllerState.RUNNING | ControllerState.PAUSED):
+            self._set_state(ControllerState.STOPPED)
 
     def pause_crafting(self) -> None:
         """
         Pause the current crafting process.
         """
         if self._state == ControllerState.RUNNING:
-            self._state = ControllerState.PAUSED
-            self._pause_event.clear()
-            self._view.notify(Notification.CONTROLLER_STATE, self._state)
+            self._set_state(ControllerState.PAUSED)
 
     def resume_crafting(self) -> None:
         """
         Resume a paused crafting process.
         """
         if self._state == ControllerState.PAUSED:
-            self._state = ControllerState.RUNNING
-            self._pause_event.set()
-            self._view.notify(Notification.CONTROLLER_STATE, self._state)
+            self._set_state(ControllerState.RUNNING)
         
+    def _set_state(self, state: ControllerState) -> None:
+        """
+        Internal method to change the controller state, wake the crafting thread and notify the view.
+        
+        Args:
+            state: The new controller state
+        """
+        with self._state_changed:
+            self._state = state
+            self._state_changed.notify_all()
+        self._notify(Notification.CONTROLLER_STATE, state)
+
     def _manage_buffs(self, recipe: Recipe) -> bool:
         """
         Internal method to manage food and potion buffs during crafting.
         Checks if buffs are active and reapplies them if necessary.
         """
-        if not self._model.food_f_action.shortcut:
-            raise self.CraftingError("Food action not configured.")
-        if not self._model.potion_f_action.shortcut:
-            raise self.CraftingError("Potion action not configured.")
-
-        must_eat = recipe.use_food and (self._food_time is None or (time.time() - self._food_time) > FOOD_DURATION)
-        must_drink = recipe.use_potion and (self._potion_time is None or (time.time() - self._potion_time) > POTION_DURATION)
+        now = time.monotonic()
+        must_eat = recipe.use_food and (self._food_deadline is None or now >= self._food_deadline)
+        must_drink = recipe.use_potion and (self._potion_deadline is None or now >= self._potion_deadline)
 
         # Check food buff
         if must_eat or must_drink:
@@ -302,23 +400,32 @@ class XIVAutoCrafterController(AutoCrafterControllerInterface):
                 time.sleep(1)  # Allow time for the character to get up
 
             if must_eat:
-                self._view.log("Using food (30 minute buff)...")
-                self._food_time = time.time()
+                self._log("Using food (30 minute buff)...")
+                self._food_deadline = now + FOOD_DURATION
                 self._model.food_f_action.execute()
 
             if must_drink:
-                self._view.log("Using potion (15 minute buff)...")
-                self._potion_time = time.time()
+                self._log("Using potion (15 minute buff)...")
+                self._potion_deadline = now + POTION_DURATION
                 self._model.potion_f_action.execute()
 
             self._model.recipe_book_f_action.execute()
-            self._model.confirm_f_action.execute()
-            self._model.confirm_f_action.execute()
-            self._model.confirm_f_action.execute()
+            self._confirm(3)
             return True
         
         return False
 
+    def _confirm(self, times: int = 1) -> None:
+        """
+        Press the confirm action a number of times in a row.
+        
+        Args:
+            times: Number of confirm presses (defaults to 1)
+        """
+        execute = self._model.confirm_f_action.execute
+        for _ in range(times):
+            execute()
+
     def _set_hq(self):
         """
         Inputs to set the all ingredients in HQ.
@@ -339,47 +446,91 @@ class XIVAutoCrafterController(AutoCrafterControllerInterface):
         """
         if not self._selected_recipe or not (recipe := self._model.recipes.get(self._selected_recipe)):
             error_msg = "No recipe selected for crafting." if not self._selected_recipe else f"Recipe '{self._selected_recipe}' not found."
-            self._view.log(error_msg, severity=LogSeverity.ERROR)
+            self._log(error_msg, severity=LogSeverity.ERROR)
             self.stop_crafting()
             return
 
-        just_buffed = False
+        # Buff shortcuts are validated once per run instead of on every item
+        if recipe.use_food and not self._model.food_f_action.shortcut:
+            self._log("Food action not configured.", severity=LogSeverity.ERROR)
+            self.stop_crafting()
+            return
+        if recipe.use_potion and not self._model.potion_f_action.shortcut:
+            self._log("Potion action not configured.", severity=LogSeverity.ERROR)
+            self.stop_crafting()
+            return
 
         # Wait for the craft window to be visible
-        if not self._model.find_craft_window():
-            self._view.log("Waiting for craft window to be ready.\nMake sure the game window is visible",severity=LogSeverity.INFO)
-            while not self._model.find_craft_window():
-                if self._state == ControllerState.STOPPED:
-                    break
-                time.sleep(1)
+        # Back off between OCR passes while the window takes its time to show up
+        delay = CRAFT_WINDOW_POLL_MIN
+        waiting_logged = False
+        while not self._model.find_craft_window():
+            if not waiting_logged:
+                self._log("Waiting for craft window to be ready.\nMake sure the game window is visible",severity=LogSeverity.INFO)
+                waiting_logged = True
+            if self._state & ControllerState.STOPPED:
+                break
+            time.sleep(delay)
+            delay = min(delay * CRAFT_WINDOW_POLL_FACTOR, CRAFT_WINDOW_POLL_MAX)
+
+        # Bind loop invariants to locals to avoid attribute lookups on every item
+        quantity = self._quantity
+        use_hq_ingredients = recipe.use_hq_ingredients
+        recipe_execute = recipe.execute
+        actions = self._model.actions
+        confirm = self._model.confirm_f_action.execute
+        set_hq = self._set_hq
+        manage_buffs = self._manage_buffs
+        log = self._log
+        set_progress = self._set_progress
+
+        # Only report every 1% of the batch to keep log and progress bar redraws bounded
+        report_every = max(1, quantity // 100)
 
         # Main crafting loop
-        for i in range(self._quantity):
-
-            if self._state == ControllerState.STOPPED:
+        for i in range(quantity):
+            report = (i + 1) % report_every == 0 or i + 1 == quantity
+
+            # The running path is a single attribute read, a pause sleeps until the state changes
+            if self._state & ControllerState.PAUSED:
+                with self._state_changed:
+                    self._state_changed.wait_for(lambda: not self._state & ControllerState.PAUSED)
+            if self._state & ControllerState.STOPPED:
                 break
-            self._pause_event.wait()
 
             # Manage buffs before each item
-            just_buffed = self._manage_buffs(recipe)
+            just_buffed = manage_buffs(recipe)
             if not just_buffed:
-                self._model.confirm_f_action.execute()
+                confirm()
 
             # Manage HQ selection on first item or if buffs were just applied
-            if recipe.use_hq_ingredients and (just_buffed or i == 0):
-                self._set_hq()
+            if use_hq_ingredients and (just_buffed or i == 0):
+                set_hq()
 
             # Start the crafting process
-            self._model.confirm_f_action.execute()
-            self._view.log(f"Crafting item {i+1}/{self._quantity}...")
+            confirm()
+            if report:
+                log(f"Crafting item {i+1}/{quantity}...")
 
             time.sleep(1)  # Allow time for the character to sit down
-            recipe.execute(self._model.actions)
+            recipe_execute(actions)
             time.sleep(1)
-            self._view.set_progress((i+1)/self._quantity)
+            if report:
+                set_progress((i+1)/quantity)
 
         self.stop_crafting()
 
+    def _set_fixed_action(self, attribute: str, shortcut: str) -> None:
+        """
+        Internal method to set the shortcut of a fixed action in the model and queue a save.
+        
+        Args:
+            attribute: Name of the fixed action attribute in the model
+            shortcut: The key combination for the fixed action
+        """
+        getattr(self._model, attribute).shortcut = shortcut
+        self._request_save()
+
     def set_confirm_action(self, shortcut: str) -> None:
         """
         Set the confirm action shortcut in the model.
@@ -387,8 +538,7 @@ class XIVAutoCrafterController(AutoCrafterControllerInterface):
         Args:
             shortcut: The key combination for confirming actions
         """
-        self._model.confirm_f_action.shortcut = shortcut
-        self._model.save_data()
+        self._set_fixed_action("confirm_f_action", shortcut)
 
     def set_cancel_action(self, shortcut: str) -> None:
         """
@@ -397,8 +547,7 @@ class XIVAutoCrafterController(AutoCrafterControllerInterface):
         Args:
             shortcut: The key combination for cancelling actions
         """
-        self._model.cancel_f_action.shortcut = shortcut
-        self._model.save_data()
+        self._set_fixed_action("cancel_f_action", shortcut)
 
     def set_food_action(self, shortcut: str) -> None:
         """
@@ -407,8 +556,7 @@ class XIVAutoCrafterController(AutoCrafterControllerInterface):
         Args:
             shortcut: The key combination for consuming food
         """
-        self._model.food_f_action.shortcut = shortcut
-        self._model.save_data()
+        self._set_fixed_action("food_f_action", shortcut)
 
     def set_potion_action(self, shortcut: str) -> None:
         """
@@ -417,8 +565,7 @@ class XIVAutoCrafterController(AutoCrafterControllerInterface):
         Args:
             shortcut: The key combination for drinking a CP potion
         """
-        self._model.potion_f_action.shortcut = shortcut
-        self._model.save_data()
+        self._set_fixed_action("potion_f_action", shortcut)
 
     def set_recipe_book_action(self, shortcut: str) -> None:
         """
@@ -427,8 +574,7 @@ class XIVAutoCrafterController(AutoCrafterControllerInterface):
         Args:
             shortcut: The key combination for opening/closing the recipe book
         """
-        self._model.recipe_book_f_action.shortcut = shortcut
-        self._model.save_data()
+        self._set_fixed_action("recipe_book_f_action", shortcut)
 
     def set_up_action(self, shortcut: str) -> None:
         """
@@ -437,8 +583,7 @@ class XIVAutoCrafterController(AutoCrafterControllerInterface):
         Args:
             shortcut: The key combination for moving up
         """
-        self._model.up_f_action.shortcut = shortcut
-        self._model.save_data()
+        self._set_fixed_action("up_f_action", shortcut)
 
     def set_down_action(self, shortcut: str) -> None:
         """
@@ -447,8 +592,7 @@ class XIVAutoCrafterController(AutoCrafterControllerInterface):
         Args:
             shortcut: The key combination for moving down
         """
-        self._model.down_f_action.shortcut = shortcut
-        self._model.save_data()
+        self._set_fixed_action("down_f_action", shortcut)
 
     def set_left_action(self, shortcut: str) -> None:
         """
@@ -457,8 +601,7 @@ class XIVAutoCrafterController(AutoCrafterControllerInterface):
         Args:
             shortcut: The key combination for moving left
         """
-        self._model.left_f_action.shortcut = shortcut
-        self._model.save_data()
+        self._set_fixed_action("left_f_action", shortcut)
 
     def set_right_action(self, shortcut: str) -> None:
         """
@@ -467,5 +610,4 @@ class XIVAutoCrafterController(AutoCrafterControllerInterface):
         Args:
             shortcut: The key combination for moving right
         """
-        self._model.right_f_action.shortcut = shortcut
-        self._model.save_data()
+        self._set_fixed_action("right_f_action", shortcut)
@@ -7,13 +7,32 @@ from pywinauto import Application, findwindows
 import screen_ocr
 import sys
 import os
+import threading
 import time
 import json
 from pathlib import Path
 
+# orjson is optional, the standard json module is used when it is not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 WINDOW_TITLE = "FINAL FANTASY XIV"
+WINDOW_TITLE_RE = ".*FINAL FANTASY XIV.*"
 CRAFTING_LOG_TITLES = ["Crafting log", "Carnet d'artisanat", "HANDWERKER-NOTIZBUCH", "CRAFTING LOG"]
 
+# Seconds during which a craft window check result is reused
+CRAFT_WINDOW_CACHE_TTL = 0.2
+# Pixels of margin around the last crafting log title position read before falling back to the whole window
+TITLE_SEARCH_MARGIN = 100
+
+# Attribute names of the fixed actions held by the model
+FIXED_ACTION_NAMES = (
+    "confirm_f_action", "cancel_f_action", "food_f_action", "potion_f_action", "recipe_book_f_action",
+    "up_f_action", "down_f_action", "left_f_action", "right_f_action"
+)
+
 # Determine the correct location for data.json
 # Store user data in AppData to persist across reinstalls
 if getattr(sys, 'frozen', False):
@@ -25,8 +44,16 @@ else:
     # Running as script - use the parent directory of the script
     SAVE_LOCATION = Path(__file__).parent.parent / "data.json"
 
+# Serializes filling and clearing the to_dict caches of actions and recipes,
+# which are read by the background save writer while the UI thread modifies them
+_dict_cache_lock = threading.Lock()
+
 # Global Application instance for FFXIV window automation
 _ffxiv_app = None
+# Cached FFXIV window wrapper keystrokes are sent to
+_ffxiv_window = None
+# Global OCR reader, created on first use
+_ocr_reader = None
 
 def get_ffxiv_app():
     """
@@ -45,24 +72,75 @@ def get_ffxiv_app():
             else:
                 _ffxiv_app = None
         
-        # Find and connect to FFXIV window
-        windows = findwindows.find_windows(title_re=".*FINAL FANTASY XIV.*")
-        if not windows:
-            return None
+        # Find the FFXIV window by exact title first, the title regex walks every window
+        hwnd = win32gui.FindWindow(None, WINDOW_TITLE)
+        if not hwnd:
+            windows = findwindows.find_windows(title_re=WINDOW_TITLE_RE)
+            if not windows:
+                return None
+            hwnd = windows[0]
         
         # Connect to the first FFXIV window found
-        _ffxiv_app = Application().connect(handle=windows[0])
+        _ffxiv_app = Application().connect(handle=hwnd)
         return _ffxiv_app
         
     except Exception as e:
         _ffxiv_app = None
         return None
 
+def get_ffxiv_window():
+    """
+    Get the FFXIV game window wrapper used to send keystrokes.
+    The wrapper is cached and only resolved again once its window is gone.
+    
+    Returns:
+        pywinauto window wrapper of the FFXIV window, or None if not found
+    """
+    global _ffxiv_window
+    
+    if _ffxiv_window is not None and win32gui.IsWindow(_ffxiv_window.handle):
+        return _ffxiv_window
+    
+    _ffxiv_window = None
+    app = get_ffxiv_app()
+    if app is None:
+        return None
+    
+    try:
+        _ffxiv_window = app.window(handle=app.top_window().handle).wrapper_object()
+    except Exception:
+        _ffxiv_window = None
+    return _ffxiv_window
+
+def reset_ffxiv_connection():
+    """
+    Drop the cached FFXIV application and window so they are resolved again on next use.
+    """
+    global _ffxiv_app, _ffxiv_window
+    _ffxiv_app = None
+    _ffxiv_window = None
+
+def get_ocr_reader():
+    """
+    Get or create the global OCR reader.
+    The reader is only created on first use since loading the OCR backend is slow.
+    
+    Returns:
+        screen_ocr Reader instance
+    """
+    global _ocr_reader
+    
+    if _ocr_reader is None:
+        _ocr_reader = screen_ocr.Reader.create_quality_reader()
+    return _ocr_reader
+
 class Action:
     """
     Represents a single crafting action with a keyboard shortcut and execution duration.
     Used to automate individual crafting steps in FFXIV.
     """
+
+    __slots__ = ("_shortcut", "_keystrokes", "_duration", "_dict_cache")
     
     # Comprehensive key mapping for pywinauto
     # Special characters that need escaping
@@ -170,6 +248,9 @@ class Action:
         'numpaddivide': '{VK_DIVIDE}', 'num/': '{VK_DIVIDE}',
         'numpadenter': '{VK_RETURN}'
     }
+
+    # All named keys and escaped characters merged for a single lookup
+    KEY_MAP = {**FUNCTION_KEYS, **SPECIAL_KEYS, **NUMPAD_KEYS, **SPECIAL_CHARS}
     
     def __init__(self, shortcut: str, duration: int = 3):
         """
@@ -182,31 +263,88 @@ class Action:
         self.shortcut = shortcut
         self.duration = duration
 
-    def _send_shortcut(self, key: str, shift: bool = False, alt: bool = False, ctrl: bool = False):
+    @property
+    def shortcut(self) -> str:
+        """The key combination sent to the game."""
+        return self._shortcut
+
+    @shortcut.setter
+    def shortcut(self, shortcut: str):
+        # Keystrokes are compiled once here so execute() only has to send them
+        self._shortcut = shortcut
+        self._keystrokes = self._compile_shortcut(shortcut)
+        self._reset_dict_cache()
+
+    @property
+    def duration(self) -> int:
+        """Cooldown in seconds after sending the key."""
+        return self._duration
+
+    @duration.setter
+    def duration(self, duration: int):
+        self._duration = duration
+        self._reset_dict_cache()
+
+    def _reset_dict_cache(self) -> None:
+        """
+        Drop the cached dictionary so that to_dict rebuilds it on next call.
         """
-        Send a single key with optional modifiers to the FFXIV window.
+        with _dict_cache_lock:
+            self._dict_cache = None
+
+    @classmethod
+    def _compile_shortcut(cls, shortcut: str) -> str:
+        """
+        Convert a shortcut into the pywinauto keystrokes to send.
+        Modifiers are repeated before each main key so that all keys go out in a single call.
         
         Args:
-            key: The key to send
+            shortcut: The key combination (e.g., 'Ctrl+F1', 'Alt+Q')
+            
+        Returns:
+            pywinauto keystroke string, empty if the shortcut cannot be parsed
+        """
+        try:
+            # Split shortcut into components
+            keys = [k.strip() for k in shortcut.split('+')]
+        except Exception:
+            return ""
+        modifiers = [k.lower() for k in keys if k.lower() in ('ctrl', 'alt', 'shift')]
+        main_keys = [k for k in keys if k.lower() not in ('ctrl', 'alt', 'shift')]
+        
+        return "".join(
+            cls._convert_key(
+                key=key,
+                shift='shift' in modifiers,
+                alt='alt' in modifiers,
+                ctrl='ctrl' in modifiers
+            )
+            for key in main_keys
+        )
+
+    @classmethod
+    def _convert_key(cls, key: str, shift: bool = False, alt: bool = False, ctrl: bool = False) -> str:
+        """
+        Convert a single key with optional modifiers to pywinauto format.
+        
+        Args:
+            key: The key to convert
             shift: Whether to hold Shift modifier
             alt: Whether to hold Alt modifier  
             ctrl: Whether to hold Ctrl modifier
+            
+        Returns:
+            The pywinauto keystroke string
         """
         key_lower = key.lower().strip()
         
         # Convert key to proper pywinauto format
-        if key_lower in self.FUNCTION_KEYS:
-            converted_key = self.FUNCTION_KEYS[key_lower]
-        elif key_lower in self.SPECIAL_KEYS:
-            converted_key = self.SPECIAL_KEYS[key_lower]
-        elif key_lower in self.NUMPAD_KEYS:
-            converted_key = self.NUMPAD_KEYS[key_lower]
-        elif key.isdigit() and len(key) == 1:
-            converted_key = f"{{VK_NUMPAD{key}}}"
-        elif key in self.SPECIAL_CHARS:
-            converted_key = self.SPECIAL_CHARS[key]
-        else:
-            converted_key = key
+        converted_key = cls.KEY_MAP.get(key_lower)
+        if converted_key is None:
+            if key.isdigit() and len(key) == 1:
+                converted_key = f"{{VK_NUMPAD{key}}}"
+            else:
+                converted_key = key
         
         # Apply modifiers
         if shift:
@@ -215,66 +353,61 @@ class Action:
             converted_key = "%" + converted_key
         if ctrl:
             converted_key = "^" + converted_key
+        return converted_key
+
+    def _send_shortcut(self, keystrokes: str):
+        """
+        Send compiled keystrokes to the FFXIV window.
         
-        # Get the global FFXIV app and send keystrokes
-        app = get_ffxiv_app()
-        if app is None:
+        Args:
+            keystrokes: The keystrokes in pywinauto format
+        """
+        # Get the cached FFXIV window and send keystrokes
+        window = get_ffxiv_window()
+        if window is None:
             raise RuntimeError("Could not connect to FFXIV window")
             
         try:
-            window = app.window(handle=app.top_window().handle)
-            window.send_keystrokes(converted_key)
+            window.send_keystrokes(keystrokes)
         except Exception as e:
-            raise RuntimeError(f"Failed to send keystroke '{converted_key}' to FFXIV window: {e}") from e
+            reset_ffxiv_connection()
+            raise RuntimeError(f"Failed to send keystroke '{keystrokes}' to FFXIV window: {e}") from e
 
     def execute(self):
         """
         Execute the action by sending the key combination to the FFXIV game window and waiting for cooldown.
         Uses the global FFXIV Application instance for efficient window automation.
         """
-        try:            
-            # Parse the shortcut and send using _send_shortcut method
-            
-            # Split shortcut into components
-            keys = [k.strip() for k in self.shortcut.split('+')]
-            modifiers = [k.lower() for k in keys if k.lower() in ('ctrl', 'alt', 'shift')]
-            main_keys = [k for k in keys if k.lower() not in ('ctrl', 'alt', 'shift')]
-            
-            # Validate that we have main keys to send
-            if not main_keys:
-                return
-            
-            # Send each main key with the appropriate modifiers
-            for key in main_keys:
-                try:
-                    self._send_shortcut(
-                        key=key,
-                        shift='shift' in modifiers,
-                        alt='alt' in modifiers,
-                        ctrl='ctrl' in modifiers
-                    )
-                except Exception as e:
-                    # Continue with other keys rather than failing completely
-                    continue
-            
-        except Exception as e:
-            pass
+        # The cooldown starts when the action is triggered, time spent sending keys counts towards it
+        deadline = time.monotonic() + self.duration
+        
+        # All main keys are sent with their modifiers in a single call
+        if self._keystrokes:
+            try:
+                self._send_shortcut(self._keystrokes)
+            except Exception:
+                pass
         
         # Always wait for cooldown, even if sending keys failed
-        if self.duration > 0:
-            time.sleep(self.duration)
+        remaining = deadline - time.monotonic()
+        if remaining > 0:
+            time.sleep(remaining)
 
     def to_dict(self) -> dict:
         """
         Convert Action to dictionary for JSON serialization.
+        The dictionary is cached until the action is modified.
         
         Returns:
             Dictionary representation of the Action
         """
-        return {
-            "shortcut": self.shortcut,
-            "duration": self.duration
-        }
+        with _dict_cache_lock:
+            if self._dict_cache is None:
+                self._dict_cache = {
+                    "shortcut": self.shortcut,
+                    "duration": self.duration
+                }
+            return self._dict_cache
 
     @classmethod
     def from_dict(cls, data: dict) -> 'Action':
@@ -294,6 +427,8 @@ class Recipe:
     Represents a crafting recipe consisting of a sequence of action names.
     Used to automate complete crafting rotations in FFXIV.
     """
+
+    __slots__ = ("_action_names", "_use_food", "_use_potion", "_use_hq_ingredients", "_dict_cache", "_resolved")
     
     def __init__(self, action_names: list[str], use_food: bool = False, use_potion: bool = False, use_hq_ingredients: bool = False):
         """
@@ -310,35 +445,114 @@ class Recipe:
         self.use_potion = use_potion
         self.use_hq_ingredients = use_hq_ingredients
 
+    @property
+    def action_names(self) -> list[str]:
+        """
+        List of action names that make up the recipe.
+        Assigning a new list also drops the cached dictionary and resolved actions.
+        """
+        return self._action_names
+
+    @action_names.setter
+    def action_names(self, action_names: list[str]) -> None:
+        self._action_names = action_names
+        self._reset_dict_cache()
+        self._resolved = None
+
+    @property
+    def use_food(self) -> bool:
+        """Whether to execute food action before the recipe."""
+        return self._use_food
+
+    @use_food.setter
+    def use_food(self, use_food: bool) -> None:
+        self._use_food = use_food
+        self._reset_dict_cache()
+
+    @property
+    def use_potion(self) -> bool:
+        """Whether to execute potion action before the recipe."""
+        return self._use_potion
+
+    @use_potion.setter
+    def use_potion(self, use_potion: bool) -> None:
+        self._use_potion = use_potion
+        self._reset_dict_cache()
+
+    @property
+    def use_hq_ingredients(self) -> bool:
+        """Whether to use HQ ingredients for the recipe."""
+        return self._use_hq_ingredients
+
+    @use_hq_ingredients.setter
+    def use_hq_ingredients(self, use_hq_ingredients: bool) -> None:
+        self._use_hq_ingredients = use_hq_ingredients
+        self._reset_dict_cache()
+
+    def _reset_dict_cache(self) -> None:
+        """
+        Drop the cached dictionary so that to_dict rebuilds it on next call.
+        """
+        with _dict_cache_lock:
+            self._dict_cache = None
+
+    def update(self, action_names: list[str], use_food: bool = False, use_potion: bool = False, use_hq_ingredients: bool = False) -> None:
+        """
+        Replace the content of the recipe in place.
+        
+        Args:
+            action_names: List of action names that make up the recipe
+            use_food: Whether to execute food action before the recipe (defaults to False)
+            use_potion: Whether to execute potion action before the recipe (defaults to False)
+            use_hq_ingredients: Whether to use HQ ingredients for the recipe (defaults to False)
+        """
+        self.action_names = action_names
+        self.use_food = use_food
+        self.use_potion = use_potion
+        self.use_hq_ingredients = use_hq_ingredients
+
+    def reset_resolved_actions(self) -> None:
+        """
+        Forget the resolved Action objects so they are looked up again on next execution.
+        Must be called when an action used by the recipe is added, replaced or removed.
+        """
+        self._resolved = None
+
     def execute(self, actions_dict: dict[str, Action]):
         """
         Execute all actions in the recipe sequentially.
         Each action will be executed with its specified cooldown before proceeding to the next.
+        Action names are resolved once and reused until reset_resolved_actions is called.
         
         Args:
             actions_dict: Dictionary of available actions to execute by name
         """
-        for action_name in self.action_names:
-            if action_name == "Deleted action":
-                continue
-            elif action_name in actions_dict:
-                actions_dict[action_name].execute()
-            else:
-                pass
+        resolved = self._resolved
+        if resolved is None:
+            resolved = self._resolved = [
+                actions_dict[action_name] for action_name in self.action_names
+                if action_name != "Deleted action" and action_name in actions_dict
+            ]
+        for action in resolved:
+            action.execute()
 
     def to_dict(self) -> dict:
         """
         Convert Recipe to dictionary for JSON serialization.
+        The dictionary is cached until the recipe is modified.
         
         Returns:
             Dictionary representation of the Recipe
         """
-        return {
-            "actions": self.action_names,
-            "use_food": self.use_food,
-            "use_potion": self.use_potion,
-            "use_hq_ingredients": self.use_hq_ingredients
-        }
+        with _dict_cache_lock:
+            if self._dict_cache is None:
+                self._dict_cache = {
+                    "actions": self.action_names,
+                    "use_food": self.use_food,
+                    "use_potion": self.use_potion,
+                    "use_hq_ingredients": self.use_hq_ingredients
+                }
+            return self._dict_cache
 
     @classmethod
     def from_dict(cls, data: dict) -> 'Recipe':
@@ -351,7 +565,9 @@ class Recipe:
         Returns:
             Recipe object created from the data
         """
-        return cls(data["actions"], data.get("use_food", False), data.get("use_potion", False), data.get("use_hq_ingredients", False))
+        # Interned names share their string object with the action dictionary keys
+        action_names = [sys.intern(action_name) for action_name in data["actions"]]
+        return cls(action_names, data.get("use_food", False), data.get("use_potion", False), data.get("use_hq_ingredients", False))
 
 class XIVAutoCrafterModel:
     """
@@ -368,6 +584,8 @@ class XIVAutoCrafterModel:
         """
         self.recipes = dict[str, Recipe]()
         self.actions = dict[str, Action]()
+        # Reverse index mapping each action name to the names of the recipes using it
+        self.action_recipes = dict[str, set[str]]()
         
         # Fixed actions for crafting operations
         self.confirm_f_action = Action("", 0.5)
@@ -381,31 +599,134 @@ class XIVAutoCrafterModel:
         self.right_f_action = Action("", 0.5)
 
         self._crafting_log_text = None
+        self._hwnd = None
+        self._craft_window_found = False
+        self._craft_window_checked_at = float("-inf")
+        # Position of the crafting log title relative to the game window, from the last match
+        self._title_box = None
+
+    def index_recipe(self, name: str, recipe: Recipe) -> None:
+        """
+        Register the actions used by a recipe in the reverse index.
+        
+        Args:
+            name: Name of the recipe
+            recipe: Recipe to register
+        """
+        for action_name in recipe.action_names:
+            self.action_recipes.setdefault(action_name, set()).add(name)
+
+    def unindex_recipe(self, name: str, recipe: Recipe) -> None:
+        """
+        Remove the actions used by a recipe from the reverse index.
+        
+        Args:
+            name: Name of the recipe
+            recipe: Recipe to unregister
+        """
+        for action_name in recipe.action_names:
+            recipe_names = self.action_recipes.get(action_name)
+            if recipe_names is not None:
+                recipe_names.discard(name)
+                if not recipe_names:
+                    del self.action_recipes[action_name]
 
-        self._ocr_reader = screen_ocr.Reader.create_quality_reader()
+    def reset_resolved_actions(self, action_name: str) -> None:
+        """
+        Make the recipes using an action resolve their actions again on next execution.
+        
+        Args:
+            action_name: Name of the action that was added, replaced or removed
+        """
+        for recipe_name in self.action_recipes.get(action_name, ()):
+            self.recipes[recipe_name].reset_resolved_actions()
+
+    def _get_game_window(self) -> int:
+        """
+        Get the handle of the FFXIV window.
+        The handle is cached and only looked up again once the window is gone.
+        
+        Returns:
+            The window handle, or 0 if the game window was not found
+        """
+        if not self._hwnd or not win32gui.IsWindow(self._hwnd):
+            self._hwnd = win32gui.FindWindow(None, WINDOW_TITLE)
+        return self._hwnd
 
     def find_craft_window(self) -> bool:
+        """
+        Check whether the crafting log is open in the game window.
+        The result is reused for a short time so that back-to-back checks share a single OCR pass.
+        
+        Returns:
+            True if the crafting log title was found, False otherwise
+        """
+        now = time.monotonic()
+        if now - self._craft_window_checked_at < CRAFT_WINDOW_CACHE_TTL:
+            return self._craft_window_found
+        found = self._read_craft_window()
+        self._craft_window_found = found
+        self._craft_window_checked_at = time.monotonic()
+        return found
+
+    def _read_craft_window(self) -> bool:
+        """
+        Run OCR on the game window and look for the crafting log title.
+        
+        Returns:
+            True if the crafting log title was found, False otherwise
+        """
         try:
-            hwnd = win32gui.FindWindow(None, WINDOW_TITLE)
+            hwnd = self._get_game_window()
             if not hwnd:
                 return False
                 
             window_rect = win32gui.GetWindowRect(hwnd)
-            result = self._ocr_reader.read_screen(window_rect)
 
-            if self._crafting_log_text is not None:
-                matches = result.find_matching_words(self._crafting_log_text)
-                if matches and len(matches) > 0:
+            # The crafting log rarely moves, read around its last known title before the whole window.
+            # Only done while the log was open at the previous check, so polling a closed log stays a single pass
+            if self._craft_window_found and self._title_box is not None:
+                left, top, right, bottom = self._title_box
+                search_box = (
+                    max(window_rect[0], window_rect[0] + left - TITLE_SEARCH_MARGIN),
+                    max(window_rect[1], window_rect[1] + top - TITLE_SEARCH_MARGIN),
+                    min(window_rect[2], window_rect[0] + right + TITLE_SEARCH_MARGIN),
+                    min(window_rect[3], window_rect[1] + bottom + TITLE_SEARCH_MARGIN)
+                )
+                if self._find_crafting_log_title(search_box, window_rect):
                     return True
-            else:
-                for text in CRAFTING_LOG_TITLES:
-                    matches = result.find_matching_words(text)
-                    if matches and len(matches) > 0:
-                        self._crafting_log_text = text
-                        return True
-            return False
+            return self._find_crafting_log_title(window_rect, window_rect)
         except Exception:
+            self._hwnd = None
             return False
+
+    def _find_crafting_log_title(self, bounding_box: tuple[int, int, int, int], window_rect: tuple[int, int, int, int]) -> bool:
+        """
+        Run OCR on an area of the screen and look for the crafting log title.
+        Remembers the title position relative to the game window when found.
+        
+        Args:
+            bounding_box: Screen area to read as (left, top, right, bottom)
+            window_rect: Screen rectangle of the game window as (left, top, right, bottom)
+            
+        Returns:
+            True if the crafting log title was found, False otherwise
+        """
+        result = get_ocr_reader().read_screen(bounding_box)
+        titles = CRAFTING_LOG_TITLES if self._crafting_log_text is None else (self._crafting_log_text,)
+        for text in titles:
+            matches = result.find_matching_words(text)
+            if matches and len(matches) > 0:
+                self._crafting_log_text = text
+                words = matches[0]
+                self._title_box = (
+                    min(word.left for word in words) - window_rect[0],
+                    min(word.top for word in words) - window_rect[1],
+                    max(word.left + word.width for word in words) - window_rect[0],
+                    max(word.top + word.height for word in words) - window_rect[1]
+                )
+                return True
+        return False
         
 
     def save_data(self) -> None:
@@ -413,17 +734,21 @@ class XIVAutoCrafterModel:
         Save recipes and actions to JSON file.
         """
         try:
-            fixed_actions_vars = vars(self)
             # Prepare data structure
+            # Snapshot the dictionaries first since they may be mutated from another thread
             data = {
-                "recipes": {name: recipe.to_dict() for name, recipe in self.recipes.items()},
-                "actions": {name: action.to_dict() for name, action in self.actions.items()},
-                "fixed_actions": {name : {"shortcut": self.__getattribute__(name).shortcut} for name in fixed_actions_vars.keys() if "f_action" in name}
+                "recipes": {name: recipe.to_dict() for name, recipe in tuple(self.recipes.items())},
+                "actions": {name: action.to_dict() for name, action in tuple(self.actions.items())},
+                "fixed_actions": {name : {"shortcut": getattr(self, name).shortcut} for name in FIXED_ACTION_NAMES}
             }
             
             # Save to file
-            with open(SAVE_LOCATION, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            if orjson is not None:
+                with open(SAVE_LOCATION, 'wb') as f:
+                    f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            else:
+                with open(SAVE_LOCATION, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, indent=2, ensure_ascii=False)
             
         except Exception as e:
             pass
@@ -437,14 +762,17 @@ class XIVAutoCrafterModel:
             if not SAVE_LOCATION.exists():
                 return
             
-            with open(SAVE_LOCATION, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            if orjson is not None:
+                data = orjson.loads(SAVE_LOCATION.read_bytes())
+            else:
+                with open(SAVE_LOCATION, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
             
             # Load actions first
             if "actions" in data:
                 for name, action_data in data["actions"].items():
                     try:
-                        self.actions[name] = Action.from_dict(action_data)
+                        self.actions[sys.intern(name)] = Action.from_dict(action_data)
                     except Exception as e:
                         pass
             
@@ -452,7 +780,9 @@ class XIVAutoCrafterModel:
             if "recipes" in data:
                 for name, recipe_data in data["recipes"].items():
                     try:
-                        self.recipes[name] = Recipe.from_dict(recipe_data)
+                        recipe = Recipe.from_dict(recipe_data)
+                        self.recipes[name] = recipe
+                        self.index_recipe(name, recipe)
                     except Exception as e:
                         pass
             